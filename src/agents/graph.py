@@ -1,5 +1,7 @@
 # src/agents/graph.py
-from typing import Literal
+from typing import Any, Callable, Dict, Iterator, Literal, Optional
+from langchain_core.messages import AIMessageChunk
+from langchain_core.runnables import RunnableConfig
 from langgraph.graph import StateGraph, END
 from src.agents.state import AgentState
 from src.agents.nodes import AgentNodes
@@ -9,6 +11,64 @@ from src.tools.generation_tools import GenerationTools
 from src.memory.long_term_memory import LongTermMemory
 from src.memory.company_research_cache import CompanyResearchCache
 
+def _node(method_name: str):
+    """Graph node that delegates to the AgentNodes instance supplied in the run config"""
+    def run(state: AgentState, config: RunnableConfig) -> Dict[str, Any]:
+        nodes = config["configurable"]["nodes"]
+        return getattr(nodes, method_name)(state)
+    
+    run.__name__ = method_name
+    return run
+
+def _should_iterate(state: AgentState) -> Literal["iterate", "refine"]:
+    """Decide whether to iterate or move to refinement"""
+    should_iterate = state.get("should_iterate", False)
+    return "iterate" if should_iterate else "refine"
+
+def _build_graph():
+    """Build and compile the LangGraph workflow"""
+    
+    # Create graph
+    workflow = StateGraph(AgentState)
+    
+    # Add nodes
+    workflow.add_node("analyze_question", _node("analyze_question_node"))
+    workflow.add_node("retrieve_context", _node("retrieve_context_node"))
+    workflow.add_node("generate_answer", _node("generate_answer_node"))
+    workflow.add_node("critique_answer", _node("critique_answer_node"))
+    workflow.add_node("refine_answer", _node("refine_answer_node"))
+    workflow.add_node("extract_key_points", _node("extract_key_points_node"))
+    workflow.add_node("predict_follow_ups", _node("predict_follow_ups_node"))
+    workflow.add_node("handle_follow_up", _node("handle_follow_up_node"))
+    
+    # Set entry point
+    workflow.set_entry_point("analyze_question")
+    
+    # Define edges
+    workflow.add_edge("analyze_question", "retrieve_context")
+    workflow.add_edge("retrieve_context", "generate_answer")
+    workflow.add_edge("generate_answer", "critique_answer")
+    
+    # Conditional edge: iterate or refine?
+    workflow.add_conditional_edges(
+        "critique_answer",
+        _should_iterate,
+        {
+            "iterate": "generate_answer",  # Loop back
+            "refine": "refine_answer"      # Move forward
+        }
+    )
+    
+    workflow.add_edge("refine_answer", "extract_key_points")
+    workflow.add_edge("extract_key_points", "predict_follow_ups")
+    workflow.add_edge("predict_follow_ups", END)
+    
+    # Compile graph
+    return workflow.compile()
+
+# Shared by every InterviewPrepAgent; pass {"configurable": {"nodes": ...}} when invoking
+COMPILED_GRAPH = _build_graph()
+
 class InterviewPrepAgent:
     """Main agent for interview preparation"""
     
@@ -29,54 +89,8 @@ class InterviewPrepAgent:
             self.generation_tools
         )
         
-        # Build graph
-        self.graph = self._build_graph()
-    
-    def _build_graph(self) -> StateGraph:
-        """Build the LangGraph workflow"""
-        
-        # Create graph
-        workflow = StateGraph(AgentState)
-        
-        # Add nodes
-        workflow.add_node("analyze_question", self.nodes.analyze_question_node)
-        workflow.add_node("retrieve_context", self.nodes.retrieve_context_node)
-        workflow.add_node("generate_answer", self.nodes.generate_answer_node)
-        workflow.add_node("critique_answer", self.nodes.critique_answer_node)
-        workflow.add_node("refine_answer", self.nodes.refine_answer_node)
-        workflow.add_node("extract_key_points", self.nodes.extract_key_points_node)
-        workflow.add_node("predict_follow_ups", self.nodes.predict_follow_ups_node)
-        workflow.add_node("handle_follow_up", self.nodes.handle_follow_up_node)
-        
-        # Set entry point
-        workflow.set_entry_point("analyze_question")
-        
-        # Define edges
-        workflow.add_edge("analyze_question", "retrieve_context")
-        workflow.add_edge("retrieve_context", "generate_answer")
-        workflow.add_edge("generate_answer", "critique_answer")
-        
-        # Conditional edge: iterate or refine?
-        workflow.add_conditional_edges(
-            "critique_answer",
-            self._should_iterate,
-            {
-                "iterate": "generate_answer",  # Loop back
-                "refine": "refine_answer"      # Move forward
-            }
-        )
-        
-        workflow.add_edge("refine_answer", "extract_key_points")
-        workflow.add_edge("extract_key_points", "predict_follow_ups")
-        workflow.add_edge("predict_follow_ups", END)
-        
-        # Compile graph
-        return workflow.compile()
-    
-    def _should_iterate(self, state: AgentState) -> Literal["iterate", "refine"]:
-        """Decide whether to iterate or move to refinement"""
-        should_iterate = state.get("should_iterate", False)
-        return "iterate" if should_iterate else "refine"
+        # Graph topology is compiled once at import; nodes are bound per run
+        self.graph = COMPILED_GRAPH
     
     def process_question(
         self,
@@ -101,8 +115,63 @@ class InterviewPrepAgent:
         Returns:
             Complete response with answer, key points, tips, and follow-ups
         """
-        # Initialize state
-        initial_state = {
+        initial_state = self._initial_state(
+            question, job_description, company_name, position, research_data, mode
+        )
+        
+        # Run the graph
+        print(f"\n{'='*60}")
+        print(f"🎯 Processing Question: {question[:50]}...")
+        print(f"{'='*60}\n")
+        
+        final_state = self.graph.invoke(
+            initial_state,
+            config={"configurable": {"nodes": self.nodes}}
+        )
+        
+        return self._build_result(question, final_state)
+    
+    def stream_question(
+        self,
+        question: str,
+        job_description: str = "",
+        company_name: str = "",
+        position: str = "",
+        research_data: dict = None,
+        mode: str = "practice",
+        on_complete: Optional[Callable[[dict], None]] = None
+    ) -> "AnswerStream":
+        """
+        Process an interview question, streaming the final answer as it is written.
+        
+        Takes the same arguments as process_question, plus on_complete, which is
+        called with the full result once the graph has finished.
+        
+        Returns:
+            AnswerStream yielding answer text chunks; its result attribute holds
+            the same dict process_question returns once iteration is done
+        """
+        initial_state = self._initial_state(
+            question, job_description, company_name, position, research_data, mode
+        )
+        
+        print(f"\n{'='*60}")
+        print(f"🎯 Streaming Question: {question[:50]}...")
+        print(f"{'='*60}\n")
+        
+        return AnswerStream(self, question, initial_state, on_complete)
+    
+    def _initial_state(
+        self,
+        question: str,
+        job_description: str,
+        company_name: str,
+        position: str,
+        research_data: Optional[dict],
+        mode: str
+    ) -> dict:
+        """Build the initial graph state for a question"""
+        return {
             "messages": [],
             "question": question,
             "question_analysis": None,
@@ -126,15 +195,9 @@ class InterviewPrepAgent:
             "delivery_tips": None,
             "error": None
         }
-        
-        # Run the graph
-        print(f"\n{'='*60}")
-        print(f"🎯 Processing Question: {question[:50]}...")
-        print(f"{'='*60}\n")
-        
-        final_state = self.graph.invoke(initial_state)
-        
-        # Extract results
+    
+    def _build_result(self, question: str, final_state: dict) -> dict:
+        """Extract the response package from the final graph state"""
         result = {
             "question": question,
             "answer": final_state.get("final_answer", ""),
@@ -189,4 +252,46 @@ class InterviewPrepAgent:
             position=context.get("position", ""),
             research_data=context.get("research_data"),
             mode=context.get("mode", "practice")
-        )
\ No newline at end of file
+        )
+
+class AnswerStream:
+    """Iterator over the final answer's text chunks as the refine step writes them"""
+    
+    def __init__(
+        self,
+        agent: InterviewPrepAgent,
+        question: str,
+        initial_state: dict,
+        on_complete: Optional[Callable[[dict], None]] = None
+    ):
+        self.agent = agent
+        self.question = question
+        self.initial_state = initial_state
+        self.on_complete = on_complete
+        self.result: Optional[dict] = None
+    
+    def __iter__(self) -> Iterator[str]:
+        final_state = self.initial_state
+        
+        for stream_mode, payload in self.agent.graph.stream(
+            self.initial_state,
+            config={"configurable": {"nodes": self.agent.nodes}},
+            stream_mode=["messages", "values"]
+        ):
+            if stream_mode == "values":
+                final_state = payload
+                continue
+            
+            # Only LLM token chunks; the node's own returned AIMessage is bookkeeping
+            chunk, metadata = payload
+            if (
+                isinstance(chunk, AIMessageChunk)
+                and metadata.get("langgraph_node") == "refine_answer"
+                and chunk.content
+            ):
+                yield chunk.content
+        
+        self.result = self.agent._build_result(self.question, final_state)
+        
+        if self.on_complete:
+            self.on_complete(self.result)
@@ -1,5 +1,6 @@
 # src/agents/mock_interview.py
 from typing import List, Dict, Any
+from datetime import datetime
 from src.tools.web_search import WebSearchTool
 from src.tools.generation_tools import GenerationTools
 from src.memory.company_research_cache import CompanyResearchCache
@@ -100,12 +101,13 @@ class MockInterviewGenerator:
         
         print(f"🔍 Researching {company_name}...")
         
-        # Perform comprehensive web search with new method names
+        # Search all sections, then synthesize them in a single LLM call
         try:
-            overview = self.web_search.search_company_overview(company_name)
-            culture = self.web_search.search_company_culture(company_name)
-            news = self.web_search.search_recent_news(company_name, days=180)
-            position_insights = self.web_search.search_position_insights(company_name, position)
+            research = self.web_search.research_company(company_name, position)
+            overview = research["overview"]
+            culture = research["culture"]
+            news = research["news"]
+            position_insights = research["position"]
             
             research_data = {
                 "company_name": company_name,
@@ -122,7 +124,7 @@ class MockInterviewGenerator:
             }
             
             # Cache the research
-            self.research_cache.save_research(company_name, research_data)
+            self.research_cache.add_research(company_name, research_data)
             
             print(f"✅ Research completed and cached")
             
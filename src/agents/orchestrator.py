@@ -1,6 +1,7 @@
 # src/agents/orchestrator.py
-from typing import Dict, Any, Optional
-from src.agents.graph import InterviewPrepAgent
+import copy
+from typing import Dict, Any, Optional, List
+from src.agents.graph import InterviewPrepAgent, AnswerStream
 from src.agents.mock_interview import MockInterviewGenerator
 from src.memory.long_term_memory import LongTermMemory
 from src.memory.short_term_memory import ShortTermMemory, InterviewMode
@@ -33,6 +34,17 @@ class InterviewPrepOrchestrator:
             self.research_cache
         )
     
+    def fork(self) -> "InterviewPrepOrchestrator":
+        """
+        Create an orchestrator for a new user session.
+        
+        The fork shares the vector stores, tools and compiled agents with this
+        instance but gets its own short-term memory, so sessions stay isolated.
+        """
+        forked = copy.copy(self)
+        forked.short_term_memory = ShortTermMemory()
+        return forked
+    
     # ============= SESSION MANAGEMENT =============
     
     def create_session(
@@ -108,9 +120,7 @@ class InterviewPrepOrchestrator:
         Returns:
             Complete answer package
         """
-        context = {}
-        if use_session_context and self.short_term_memory.current_session:
-            context = self.short_term_memory.get_context()
+        context = self._question_context(use_session_context)
         
         # Process question through agent
         result = self.agent.process_question(
@@ -122,7 +132,46 @@ class InterviewPrepOrchestrator:
             mode="practice"
         )
         
-        # Store in session
+        self._record_practice(question, result)
+        
+        return result
+    
+    def practice_question_stream(
+        self,
+        question: str,
+        use_session_context: bool = True
+    ) -> AnswerStream:
+        """
+        Practice mode: Answer a single question, streaming the final answer.
+        
+        Args:
+            question: The interview question
+            use_session_context: Use current session context
+        
+        Returns:
+            AnswerStream of answer text; the complete answer package is in
+            its result attribute once iteration finishes
+        """
+        context = self._question_context(use_session_context)
+        
+        return self.agent.stream_question(
+            question=question,
+            job_description=context.get("job_description", ""),
+            company_name=context.get("company_name", ""),
+            position=context.get("position", ""),
+            research_data=context.get("research_data"),
+            mode="practice",
+            on_complete=lambda result: self._record_practice(question, result)
+        )
+    
+    def _question_context(self, use_session_context: bool) -> Dict[str, Any]:
+        """Session context to answer a question with, if requested and available"""
+        if use_session_context and self.short_term_memory.current_session:
+            return self.short_term_memory.get_context()
+        return {}
+    
+    def _record_practice(self, question: str, result: Dict[str, Any]) -> None:
+        """Store a practiced question and its answer in the session"""
         if self.short_term_memory.current_session:
             self.short_term_memory.add_question(question)
             self.short_term_memory.add_answer(
@@ -136,8 +185,6 @@ class InterviewPrepOrchestrator:
                     "iteration": i + 1,
                     "score": result["critique_scores"].get("overall", 0)
                 })
-        
-        return result
     
     def practice_follow_up(
         self,
@@ -220,6 +267,47 @@ class InterviewPrepOrchestrator:
         Returns:
             Complete answer package
         """
+        current_question = self._current_mock_question()
+        
+        # Process the question
+        result = self.practice_question(
+            question=current_question["question"],
+            use_session_context=True
+        )
+        
+        self._record_mock_score(result)
+        
+        return result
+    
+    def answer_mock_question_stream(self) -> AnswerStream:
+        """
+        Get answer for current mock interview question, streaming the final answer.
+        
+        Returns:
+            AnswerStream of answer text; the complete answer package is in
+            its result attribute once iteration finishes
+        """
+        current_question = self._current_mock_question()
+        question = current_question["question"]
+        
+        def on_complete(result: Dict[str, Any]) -> None:
+            self._record_practice(question, result)
+            self._record_mock_score(result)
+        
+        context = self._question_context(use_session_context=True)
+        
+        return self.agent.stream_question(
+            question=question,
+            job_description=context.get("job_description", ""),
+            company_name=context.get("company_name", ""),
+            position=context.get("position", ""),
+            research_data=context.get("research_data"),
+            mode="practice",
+            on_complete=on_complete
+        )
+    
+    def _current_mock_question(self) -> Dict[str, Any]:
+        """Get the mock interview question currently being asked"""
         if not self.short_term_memory.current_session:
             raise ValueError("No active mock interview.")
         
@@ -229,13 +317,11 @@ class InterviewPrepOrchestrator:
         if current_idx < 0 or current_idx >= len(session.mock_session.generated_questions):
             raise ValueError("No current question.")
         
-        current_question = session.mock_session.generated_questions[current_idx]
-        
-        # Process the question
-        result = self.practice_question(
-            question=current_question["question"],
-            use_session_context=True
-        )
+        return session.mock_session.generated_questions[current_idx]
+    
+    def _record_mock_score(self, result: Dict[str, Any]) -> None:
+        """Store a mock answer's score and adapt difficulty"""
+        session = self.short_term_memory.current_session
         
         # Store performance score
         score = result["critique_scores"].get("overall", 0)
@@ -244,8 +330,6 @@ class InterviewPrepOrchestrator:
         # Check if we should adjust difficulty (adaptive)
         if len(session.mock_session.performance_scores) % 3 == 0:  # Every 3 questions
             self._adjust_mock_difficulty()
-        
-        return result
     
     def get_next_mock_question(self) -> Optional[Dict[str, Any]]:
         """
@@ -311,9 +395,14 @@ class InterviewPrepOrchestrator:
     
     # ============= MEMORY MANAGEMENT =============
     
-    def add_cv(self, cv_text: str, metadata: Optional[Dict] = None) -> None:
-        """Add CV to long-term memory"""
-        self.long_term_memory.add_cv(cv_text, metadata)
+    def add_cv(
+        self,
+        cv_text: str,
+        metadata: Optional[Dict] = None,
+        blocks: Optional[List[str]] = None
+    ) -> None:
+        """Add CV to long-term memory (pre-split PDF blocks skip re-chunking)"""
+        self.long_term_memory.add_cv(cv_text, metadata, blocks)
     
     def add_experience(self, experience: str, metadata: Optional[Dict] = None) -> None:
         """Add experience to long-term memory"""
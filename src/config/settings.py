@@ -32,10 +32,17 @@ class Settings(BaseSettings):
     long_term_collection_name: str = "long_term_memory"
     short_term_collection_name: str = "short_term_memory"
     company_research_collection_name: str = "research_cache"
+    # Flush new vectors to the HNSW index sooner so fresh uploads are searchable
+    chroma_hnsw_sync_threshold: int = 100
+    chroma_hnsw_batch_size: int = 100
     
     # Data Directories
     cv_dir: Path = Path("data/cv")
     experiences_dir: Path = Path("data/experiences")
+    # Practice history is shared by every session, like the long-term profile store
+    # (single-user app with no user identity); only the most recent entries are kept
+    practice_history_file: Path = Path("data/practice_history.json")
+    practice_history_max_entries: int = 50
     
     class Config:
         env_file = ".env"
@@ -21,7 +21,11 @@ class CompanyResearchCache:
         self.vectorstore = Chroma(
             collection_name=settings.company_research_collection_name,
             embedding_function=self.embeddings,
-            persist_directory=settings.chroma_persist_directory
+            persist_directory=settings.chroma_persist_directory,
+            collection_metadata={
+                "hnsw:sync_threshold": settings.chroma_hnsw_sync_threshold,
+                "hnsw:batch_size": settings.chroma_hnsw_batch_size
+            }
         )
     
     def add_research(
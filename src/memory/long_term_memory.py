@@ -2,38 +2,77 @@
 from langchain_openai import AzureOpenAIEmbeddings
 from langchain_community.vectorstores import Chroma
 from langchain_core.documents import Document
+from langchain_core.embeddings import Embeddings
 from langchain_text_splitters import RecursiveCharacterTextSplitter
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, Iterator
+from functools import lru_cache
 import json
 from datetime import datetime
 from src.config.settings import settings
 
+CV_CHUNK_SIZE = 1000
+CV_CHUNK_OVERLAP = 200
+
+class QueryCachedEmbeddings(Embeddings):
+    """Embeddings wrapper that memoizes query embeddings (documents pass through)"""
+    
+    def __init__(self, embeddings: Embeddings, maxsize: int = 1024):
+        self.embeddings = embeddings
+        self._embed_query_cached = lru_cache(maxsize=maxsize)(
+            lambda text: tuple(embeddings.embed_query(text))
+        )
+    
+    def embed_documents(self, texts: List[str]) -> List[List[float]]:
+        return self.embeddings.embed_documents(texts)
+    
+    def embed_query(self, text: str) -> List[float]:
+        return list(self._embed_query_cached(text))
+
 class LongTermMemory:
     """Manages persistent user profile information in vector store"""
     
     def __init__(self):
-        self.embeddings = AzureOpenAIEmbeddings(
-            azure_deployment=settings.azure_openai_embedding_deployment,
-            openai_api_version=settings.azure_openai_api_version,
-            azure_endpoint=settings.azure_openai_endpoint,
-            api_key=settings.azure_openai_api_key
+        # Retrieval repeats the same queries often, so skip re-embedding them
+        self.embeddings = QueryCachedEmbeddings(
+            AzureOpenAIEmbeddings(
+                azure_deployment=settings.azure_openai_embedding_deployment,
+                openai_api_version=settings.azure_openai_api_version,
+                azure_endpoint=settings.azure_openai_endpoint,
+                api_key=settings.azure_openai_api_key
+            )
         )
         
         self.vectorstore = Chroma(
             collection_name=settings.long_term_collection_name,
             embedding_function=self.embeddings,
-            persist_directory=settings.chroma_persist_directory
+            persist_directory=settings.chroma_persist_directory,
+            collection_metadata={
+                "hnsw:sync_threshold": settings.chroma_hnsw_sync_threshold,
+                "hnsw:batch_size": settings.chroma_hnsw_batch_size
+            }
         )
         
         self.text_splitter = RecursiveCharacterTextSplitter(
-            chunk_size=1000,
-            chunk_overlap=200,
+            chunk_size=CV_CHUNK_SIZE,
+            chunk_overlap=CV_CHUNK_OVERLAP,
             length_function=len,
             separators=["\n\n", "\n", ". ", " ", ""]
         )
     
-    def add_cv(self, cv_text: str, metadata: Optional[Dict[str, Any]] = None) -> None:
-        """Add CV to long-term memory with chunking"""
+    def add_cv(
+        self,
+        cv_text: str,
+        metadata: Optional[Dict[str, Any]] = None,
+        blocks: Optional[List[str]] = None
+    ) -> None:
+        """Add CV to long-term memory with chunking
+        
+        Args:
+            cv_text: Full CV text
+            metadata: Optional extra metadata (name, email, ...)
+            blocks: Parser-provided text blocks (e.g. from a PDF layout); when given
+                they are packed into chunks instead of re-splitting cv_text
+        """
         if metadata is None:
             metadata = {}
         
@@ -42,7 +81,7 @@ class LongTermMemory:
             "timestamp": datetime.now().isoformat()
         })
         
-        chunks = self.text_splitter.split_text(cv_text)
+        chunks = self._pack_blocks(blocks) if blocks else self.text_splitter.split_text(cv_text)
         documents = [
             Document(
                 page_content=chunk,
@@ -51,9 +90,32 @@ class LongTermMemory:
             for i, chunk in enumerate(chunks)
         ]
         
+        # One call: embeddings are computed before anything is written, so a failed save
+        # leaves no partial CV behind to be duplicated when the user retries
         self.vectorstore.add_documents(documents)
         print(f"✅ Added CV with {len(documents)} chunks to long-term memory")
     
+    def _pack_blocks(self, blocks: List[str]) -> Iterator[str]:
+        """Merge consecutive layout blocks into chunks of up to CV_CHUNK_SIZE characters"""
+        current = []
+        current_len = 0
+        
+        for block in blocks:
+            if current and current_len + len(block) > CV_CHUNK_SIZE:
+                yield "\n\n".join(current)
+                current, current_len = [], 0
+            
+            # A single oversized block still goes through the regular splitter
+            if len(block) > CV_CHUNK_SIZE:
+                yield from self.text_splitter.split_text(block)
+                continue
+            
+            current.append(block)
+            current_len += len(block) + 2
+        
+        if current:
+            yield "\n\n".join(current)
+    
     def add_personality(self, personality_data: Dict[str, Any]) -> None:
         """Add personality profile to long-term memory"""
         personality_text = self._format_personality(personality_data)
@@ -155,6 +217,19 @@ class LongTermMemory:
         results = self.vectorstore.similarity_search_with_score(query, **search_kwargs)
         return results
     
+    def exists(self, filter_type: str) -> bool:
+        """Check whether any memory of a type is stored (metadata lookup, no embedding)"""
+        results = self.vectorstore.get(
+            where={"type": filter_type},
+            limit=1,
+            include=[]
+        )
+        return len(results["ids"]) > 0
+    
+    def count(self) -> int:
+        """Number of documents stored in long-term memory"""
+        return len(self.vectorstore.get(include=[])["ids"])
+    
     def get_all_experiences(self) -> List[Document]:
         """Retrieve all stored experiences"""
         # Note: This is a workaround as Chroma doesn't have a direct "get all" method
@@ -174,7 +249,11 @@ class LongTermMemory:
             self.vectorstore = Chroma(
                 collection_name=settings.long_term_collection_name,
                 embedding_function=self.embeddings,
-                persist_directory=settings.chroma_persist_directory
+                persist_directory=settings.chroma_persist_directory,
+                collection_metadata={
+                    "hnsw:sync_threshold": settings.chroma_hnsw_sync_threshold,
+                    "hnsw:batch_size": settings.chroma_hnsw_batch_size
+                }
             )
             print("✅ Cleared all long-term memory")
         except Exception as e:
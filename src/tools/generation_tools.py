@@ -3,6 +3,7 @@ from langchain_core.tools import tool
 from langchain_core.prompts import ChatPromptTemplate
 from langchain_openai import AzureChatOpenAI
 from typing import List, Dict, Any
+from concurrent.futures import ThreadPoolExecutor
 from src.config.settings import settings
 import json
 import random
@@ -47,26 +48,23 @@ class GenerationTools:
         technical_count = int(count * 0.4)
         situational_count = count - behavioral_count - technical_count
         
-        questions = []
-        
-        # Generate behavioral questions
-        behavioral = self._generate_behavioral_questions(
-            company_name, position, job_description, company_research,
-            behavioral_count, difficulty
-        )
-        questions.extend(behavioral)
-        
-        # Generate technical questions
-        technical = self._generate_technical_questions(
-            position, job_description, technical_count, difficulty
-        )
-        questions.extend(technical)
-        
-        # Generate situational questions
-        situational = self._generate_situational_questions(
-            company_name, position, company_research, situational_count, difficulty
-        )
-        questions.extend(situational)
+        # The three batches are independent LLM calls, so generate them concurrently
+        with ThreadPoolExecutor(max_workers=3) as executor:
+            behavioral = executor.submit(
+                self._generate_behavioral_questions,
+                company_name, position, job_description, company_research,
+                behavioral_count, difficulty
+            )
+            technical = executor.submit(
+                self._generate_technical_questions,
+                position, job_description, technical_count, difficulty
+            )
+            situational = executor.submit(
+                self._generate_situational_questions,
+                company_name, position, company_research, situational_count, difficulty
+            )
+            
+            questions = behavioral.result() + technical.result() + situational.result()
         
         # Shuffle to mix question types
         random.shuffle(questions)
@@ -1,10 +1,26 @@
 # src/tools/web_search.py (COMPLETE WORKING VERSION)
+import logging
+from concurrent.futures import ThreadPoolExecutor
 from tavily import TavilyClient
-from typing import Dict, List, Any
+from typing import Dict, List, Any, Tuple
+from pydantic import BaseModel, Field
 from src.config.settings import settings
 from langchain_openai import AzureChatOpenAI
 from langchain_core.prompts import ChatPromptTemplate
 
+logger = logging.getLogger(__name__)
+
+# Tavily results below these thresholds are usually sitemaps or aggregator stubs
+MIN_RESULT_SCORE = 0.4
+MIN_RESULT_CONTENT_LENGTH = 200
+
+class CompanyResearch(BaseModel):
+    """Structured output for the combined research synthesis call"""
+    overview: str = Field(description="Markdown company overview")
+    culture: str = Field(description="Markdown company culture overview")
+    news: str = Field(description="Markdown summary of recent news")
+    position: str = Field(description="Markdown position analysis")
+
 class WebSearchTool:
     """Enhanced web search tool using Tavily with better result processing"""
     
@@ -20,498 +36,176 @@ class WebSearchTool:
             temperature=0.3
         )
     
-    def search_company_overview(self, company_name: str) -> Dict[str, Any]:
-        """Search for comprehensive company overview"""
-        
-        print(f"🔍 Searching company overview for {company_name}...")
-        
-        query = f"{company_name} company overview products services mission business model"
-        
-        try:
-            response = self.client.search(
-                query=query,
-                search_depth="advanced",
-                max_results=5
-            )
-            
-            results = response.get('results', [])
-            
-            if not results:
-                return {
-                    "summary": f"No information found for {company_name}.",
-                    "sources": [],
-                    "raw_results_count": 0
-                }
-            
-            print(f"   ✓ Found {len(results)} sources")
-            
-            # Extract full content from results
-            combined_content = ""
-            for i, result in enumerate(results, 1):
-                title = result.get('title', 'Unknown')
-                content = result.get('content', '')
-                url = result.get('url', '')
-                
-                combined_content += f"\n{'='*80}\n"
-                combined_content += f"SOURCE {i}: {title}\n"
-                combined_content += f"URL: {url}\n"
-                combined_content += f"{'='*80}\n"
-                combined_content += f"{content}\n\n"
-            
-            print(f"   ✓ Combined content: {len(combined_content)} characters")
-            
-            # Synthesize with LLM
-            synthesis = self._synthesize_overview(company_name, combined_content, results)
-            
-            return synthesis
-            
-        except Exception as e:
-            print(f"❌ Error searching overview: {e}")
-            import traceback
-            traceback.print_exc()
-            return {
-                "summary": f"Error researching {company_name}: {str(e)}",
-                "sources": [],
-                "raw_results_count": 0
+    def research_company(self, company_name: str, position: str) -> Dict[str, Dict[str, Any]]:
+        """
+        Research all four sections and synthesize them in a single LLM call.
+        
+        Args:
+            company_name: Name of the company
+            position: Job position
+        
+        Returns:
+            Mapping of section name (overview, culture, news, position) to
+            a dict with summary, sources and raw_results_count
+        """
+        print(f"🔍 Researching {company_name} ({position})...")
+        
+        queries = {
+            "overview": (f"{company_name} company overview products services mission business model", "SOURCE"),
+            "culture": (f"{company_name} company culture work environment employee experience benefits", "SOURCE"),
+            "news": (f"{company_name} latest news announcements developments 2024 2025", "ARTICLE"),
+            "position": (f"{position} role at {company_name} responsibilities requirements skills", "SOURCE")
+        }
+        empty_messages = {
+            "overview": f"No information found for {company_name}.",
+            "culture": f"Limited culture information available for {company_name}.",
+            "news": f"No recent news found for {company_name}.",
+            "position": f"Limited information available for {position} at {company_name}."
+        }
+        
+        # The searches are independent network calls, so run them concurrently
+        with ThreadPoolExecutor(max_workers=len(queries)) as executor:
+            futures = {
+                section: executor.submit(self._collect_sources, query, label)
+                for section, (query, label) in queries.items()
             }
-    
-    def search_company_culture(self, company_name: str) -> Dict[str, Any]:
-        """Search for company culture and work environment"""
-        
-        print(f"🔍 Searching company culture for {company_name}...")
-        
-        query = f"{company_name} company culture work environment employee experience benefits"
-        
-        try:
-            response = self.client.search(
-                query=query,
-                search_depth="advanced",
-                max_results=5
-            )
-            
-            results = response.get('results', [])
-            
-            if not results:
-                return {
-                    "summary": f"Limited culture information available for {company_name}.",
-                    "sources": [],
-                    "raw_results_count": 0
+            collected = {section: future.result() for section, future in futures.items()}
+        
+        results = {section: found for section, (found, _) in collected.items()}
+        contents = {section: content for section, (_, content) in collected.items()}
+        
+        # Nothing to synthesize; every section falls back to its empty message
+        if not any(results.values()):
+            summaries = {}
+        else:
+            try:
+                research = self._synthesize_company_research(company_name, position, contents)
+                summaries = research.model_dump()
+            except Exception as e:
+                print(f"❌ Error synthesizing research: {e}")
+                summaries = {
+                    section: f"Error creating summary: {str(e)}"
+                    for section in queries
                 }
-            
-            print(f"   ✓ Found {len(results)} sources")
-            
-            combined_content = ""
-            for i, result in enumerate(results, 1):
-                title = result.get('title', 'Unknown')
-                content = result.get('content', '')
-                url = result.get('url', '')
-                
-                combined_content += f"\n{'='*80}\n"
-                combined_content += f"SOURCE {i}: {title}\n"
-                combined_content += f"URL: {url}\n"
-                combined_content += f"{'='*80}\n"
-                combined_content += f"{content}\n\n"
-            
-            synthesis = self._synthesize_culture(company_name, combined_content, results)
-            
-            return synthesis
-            
-        except Exception as e:
-            print(f"❌ Error searching culture: {e}")
-            return {
-                "summary": f"Limited culture information available for {company_name}.",
-                "sources": [],
-                "raw_results_count": 0
+        
+        return {
+            section: {
+                "summary": summaries[section] if results[section] else empty_messages[section],
+                "sources": [
+                    {
+                        "title": r.get('title', 'Unknown'),
+                        "url": r.get('url', ''),
+                        "score": r.get('score', 0)
+                    }
+                    for r in results[section][:5]
+                ],
+                "raw_results_count": len(results[section])
             }
+            for section in queries
+        }
     
-    def search_recent_news(self, company_name: str, days: int = 180) -> Dict[str, Any]:
-        """Search for recent company news"""
-        
-        print(f"🔍 Searching recent news for {company_name}...")
-        
-        query = f"{company_name} latest news announcements developments 2024 2025"
-        
+    def _collect_sources(self, query: str, label: str = "SOURCE") -> Tuple[List[Dict], str]:
+        """Run a Tavily search and combine the filtered results into one text blob"""
         try:
             response = self.client.search(
                 query=query,
                 search_depth="advanced",
                 max_results=5
             )
-            
-            results = response.get('results', [])
-            
-            if not results:
-                return {
-                    "summary": f"No recent news found for {company_name}.",
-                    "sources": [],
-                    "raw_results_count": 0
-                }
-            
-            print(f"   ✓ Found {len(results)} news items")
-            
-            combined_content = ""
-            for i, result in enumerate(results, 1):
-                title = result.get('title', 'Unknown')
-                content = result.get('content', '')
-                url = result.get('url', '')
-                
-                combined_content += f"\n{'='*80}\n"
-                combined_content += f"ARTICLE {i}: {title}\n"
-                combined_content += f"URL: {url}\n"
-                combined_content += f"{'='*80}\n"
-                combined_content += f"{content}\n\n"
-            
-            synthesis = self._synthesize_news(company_name, combined_content, results)
-            
-            return synthesis
-            
         except Exception as e:
-            print(f"❌ Error searching news: {e}")
-            return {
-                "summary": f"No recent news found for {company_name}.",
-                "sources": [],
-                "raw_results_count": 0
-            }
-    
-    def search_position_insights(self, company_name: str, position: str) -> Dict[str, Any]:
-        """Search for position-specific insights"""
+            print(f"❌ Error searching '{query}': {e}")
+            logger.exception("Error searching %r", query)
+            return [], ""
         
-        print(f"🔍 Searching insights for {position} at {company_name}...")
+        results = response.get('results', [])
+        if not results:
+            return [], ""
         
-        query = f"{position} role at {company_name} responsibilities requirements skills"
+        results = self._filter_results(results)
         
-        try:
-            response = self.client.search(
-                query=query,
-                search_depth="advanced",
-                max_results=5
-            )
-            
-            results = response.get('results', [])
-            
-            if not results:
-                return {
-                    "summary": f"Limited information available for {position} at {company_name}.",
-                    "sources": [],
-                    "raw_results_count": 0
-                }
-            
-            print(f"   ✓ Found {len(results)} sources")
-            
-            combined_content = ""
-            for i, result in enumerate(results, 1):
-                title = result.get('title', 'Unknown')
-                content = result.get('content', '')
-                url = result.get('url', '')
-                
-                combined_content += f"\n{'='*80}\n"
-                combined_content += f"SOURCE {i}: {title}\n"
-                combined_content += f"URL: {url}\n"
-                combined_content += f"{'='*80}\n"
-                combined_content += f"{content}\n\n"
-            
-            synthesis = self._synthesize_position(company_name, position, combined_content, results)
-            
-            return synthesis
-            
-        except Exception as e:
-            print(f"❌ Error searching position: {e}")
-            return {
-                "summary": f"Limited information available for {position} at {company_name}.",
-                "sources": [],
-                "raw_results_count": 0
-            }
+        combined_content = ""
+        for i, result in enumerate(results, 1):
+            combined_content += f"\n{'='*80}\n"
+            combined_content += f"{label} {i}: {result.get('title', 'Unknown')}\n"
+            combined_content += f"URL: {result.get('url', '')}\n"
+            combined_content += f"{'='*80}\n"
+            combined_content += f"{result.get('content', '')}\n\n"
+        
+        return results, combined_content
     
-    def _synthesize_overview(self, company_name: str, content: str, sources: List[Dict]) -> Dict[str, Any]:
-        """Synthesize company overview from raw content"""
+    def _synthesize_company_research(
+        self,
+        company_name: str,
+        position: str,
+        contents: Dict[str, str]
+    ) -> CompanyResearch:
+        """Synthesize all research sections with one structured-output call"""
         
         prompt = ChatPromptTemplate.from_messages([
-            ("system", """You are a professional research analyst creating company overviews for interview preparation.
+            ("system", """You are a professional research analyst preparing a candidate for an interview.
 
-Create a comprehensive, well-structured overview with these sections:
+From the research content provided, write four independent markdown sections:
 
-## 📊 Company Overview
-- What the company does (core business, products, services)
-- Industry and market position
-- Company size, locations, year founded
-- Key customers or clients
+**overview** - use the headings:
+## 📊 Company Overview, ## 🎯 Mission & Values, ## 💼 Products & Services, ## 🏆 Notable Achievements
 
-## 🎯 Mission & Values
-- Company mission and vision
-- Core values and principles
-- What makes them unique
+**culture** - use the headings:
+## 🌟 Core Values & Culture, ## 💡 Work Environment, ## 🎁 Benefits & Perks, ## 📈 Growth & Development, ## 👥 Employee Perspectives
 
-## 💼 Products & Services
-- Main offerings
-- Target markets
-- Technology stack or approach
-- Competitive advantages
+**news** - use the headings (most recent first, include dates when available):
+## 📰 Recent Developments (Last 6 Months), ## 🤝 Partnerships & Collaborations, ## 🚀 Innovation & Growth, ## 🏅 Recognition & Awards
 
-## 🏆 Notable Achievements
-- Market recognition (awards, rankings)
-- Growth metrics
-- Key partnerships or clients
+**position** - use the headings:
+## 📋 Role Overview, ## 🎯 Required Skills & Qualifications, ## 💬 Interview Focus Areas, ## 🌱 Growth Opportunities, ## 💡 Preparation Tips
 
 **Important Guidelines:**
 - Use bullet points for clarity
 - Be specific and factual - cite numbers when available
-- If information is limited, say so clearly
-- Don't make up details
-- Focus on what's relevant for interview candidates
-- Keep it professional but engaging"""),
-            ("user", """Company: {company_name}
-
-Research Content:
-{content}
-
-Create a clear, well-organized company overview for interview preparation.""")
-        ])
-        
-        chain = prompt | self.llm
-        
-        try:
-            response = chain.invoke({
-                "company_name": company_name,
-                "content": content[:15000]  # Limit to avoid token limits
-            })
-            
-            return {
-                "summary": response.content,
-                "sources": [
-                    {
-                        "title": r.get('title', 'Unknown'),
-                        "url": r.get('url', ''),
-                        "score": r.get('score', 0)
-                    }
-                    for r in sources[:5]
-                ],
-                "raw_results_count": len(sources)
-            }
-        except Exception as e:
-            print(f"❌ Error synthesizing overview: {e}")
-            return {
-                "summary": f"Error creating summary: {str(e)}",
-                "sources": [],
-                "raw_results_count": 0
-            }
-    
-    def _synthesize_culture(self, company_name: str, content: str, sources: List[Dict]) -> Dict[str, Any]:
-        """Synthesize company culture from raw content"""
-        
-        prompt = ChatPromptTemplate.from_messages([
-            ("system", """You are a research analyst synthesizing company culture information for interview candidates.
-
-Create a comprehensive culture overview with these sections:
-
-## 🌟 Core Values & Culture
-- Company values and principles
-- Cultural philosophy
-- What they prioritize
-
-## 💡 Work Environment
-- Office culture and atmosphere
-- Remote/hybrid policies
-- Team collaboration style
-
-## 🎁 Benefits & Perks
-- Employee benefits
-- Wellness programs
-- Work-life balance initiatives
-
-## 📈 Growth & Development
-- Learning opportunities
-- Career advancement
-- Training programs
-
-## 👥 Employee Perspectives
-- What employees say (if available)
-- Glassdoor/review insights
-- Team dynamics
-
-**Guidelines:**
-- Be honest about what you find
-- Include both positives and areas of focus
-- Use specific examples when available
-- If limited info, say so clearly"""),
+- Only use the content given for each section; don't make up details
+- If information for a section is limited, say so clearly
+- Position analysis should be specific to both the role AND the company
+- Focus on what's relevant for interview candidates"""),
             ("user", """Company: {company_name}
+Position: {position}
 
-Research Content:
-{content}
-
-Synthesize this into a clear culture overview.""")
-        ])
-        
-        chain = prompt | self.llm
-        
-        try:
-            response = chain.invoke({
-                "company_name": company_name,
-                "content": content[:15000]
-            })
-            
-            return {
-                "summary": response.content,
-                "sources": [
-                    {
-                        "title": r.get('title', 'Unknown'),
-                        "url": r.get('url', ''),
-                        "score": r.get('score', 0)
-                    }
-                    for r in sources[:5]
-                ],
-                "raw_results_count": len(sources)
-            }
-        except Exception as e:
-            print(f"❌ Error synthesizing culture: {e}")
-            return {
-                "summary": f"Error creating summary: {str(e)}",
-                "sources": [],
-                "raw_results_count": 0
-            }
-    
-    def _synthesize_news(self, company_name: str, content: str, sources: List[Dict]) -> Dict[str, Any]:
-        """Synthesize recent news from raw content"""
-        
-        prompt = ChatPromptTemplate.from_messages([
-            ("system", """You are a research analyst synthesizing recent company news for interview preparation.
-
-Create a news summary with these sections:
-
-## 📰 Recent Developments (Last 6 Months)
-- Major announcements
-- Product launches
-- Business expansions
-
-## 🤝 Partnerships & Collaborations
-- Strategic partnerships
-- Acquisitions or mergers
-- New market entries
-
-## 🚀 Innovation & Growth
-- New technologies or products
-- R&D initiatives
-- Market expansion
+=== OVERVIEW RESEARCH ===
+{overview}
 
-## 🏅 Recognition & Awards
-- Industry recognition
-- Rankings or certifications
-- Customer wins
+=== CULTURE RESEARCH ===
+{culture}
 
-**Guidelines:**
-- Organize chronologically (most recent first)
-- Be factual and specific
-- Include dates when available
-- Focus on what's relevant for candidates
-- If news is limited or outdated, say so clearly"""),
-            ("user", """Company: {company_name}
+=== NEWS RESEARCH ===
+{news}
 
-Recent News Content:
-{content}
+=== POSITION RESEARCH ===
+{position_content}
 
-Create a clear, organized news summary.""")
+Write the four sections.""")
         ])
         
-        chain = prompt | self.llm
-        
-        try:
-            response = chain.invoke({
-                "company_name": company_name,
-                "content": content[:15000]
-            })
-            
-            return {
-                "summary": response.content,
-                "sources": [
-                    {
-                        "title": r.get('title', 'Unknown'),
-                        "url": r.get('url', ''),
-                        "score": r.get('score', 0)
-                    }
-                    for r in sources[:5]
-                ],
-                "raw_results_count": len(sources)
-            }
-        except Exception as e:
-            print(f"❌ Error synthesizing news: {e}")
-            return {
-                "summary": f"Error creating summary: {str(e)}",
-                "sources": [],
-                "raw_results_count": 0
-            }
+        # function_calling works on every Azure API version; json_schema needs 2024-08-01-preview+
+        chain = prompt | self.llm.with_structured_output(CompanyResearch, method="function_calling")
+        
+        return chain.invoke({
+            "company_name": company_name,
+            "position": position,
+            "overview": contents["overview"][:15000],
+            "culture": contents["culture"][:15000],
+            "news": contents["news"][:15000],
+            "position_content": contents["position"][:15000]
+        })
     
-    def _synthesize_position(self, company_name: str, position: str, content: str, sources: List[Dict]) -> Dict[str, Any]:
-        """Synthesize position-specific insights from raw content"""
-        
-        prompt = ChatPromptTemplate.from_messages([
-            ("system", """You are a research analyst creating role-specific insights for interview candidates.
-
-Create a position analysis with these sections:
-
-## 📋 Role Overview
-- Key responsibilities
-- Day-to-day activities
-- Team structure
-
-## 🎯 Required Skills & Qualifications
-- Technical skills
-- Soft skills
-- Experience requirements
-- Nice-to-have qualifications
-
-## 💬 Interview Focus Areas
-- Common interview topics
-- Technical assessments
-- Behavioral questions likely to come up
-
-## 🌱 Growth Opportunities
-- Career progression
-- Learning opportunities
-- Impact potential
-
-## 💡 Preparation Tips
-- What to emphasize in your application
-- How to stand out
-- Company-specific considerations
-
-**Guidelines:**
-- Be specific to both the role AND the company
-- Provide actionable insights
-- If info is limited, provide general role insights
-- Focus on interview preparation"""),
-            ("user", """Company: {company_name}
-Position: {position}
-
-Research Content:
-{content}
-
-Create a comprehensive position analysis.""")
-        ])
-        
-        chain = prompt | self.llm
-        
-        try:
-            response = chain.invoke({
-                "company_name": company_name,
-                "position": position,
-                "content": content[:15000]
-            })
-            
-            return {
-                "summary": response.content,
-                "sources": [
-                    {
-                        "title": r.get('title', 'Unknown'),
-                        "url": r.get('url', ''),
-                        "score": r.get('score', 0)
-                    }
-                    for r in sources[:5]
-                ],
-                "raw_results_count": len(sources)
-            }
-        except Exception as e:
-            print(f"❌ Error synthesizing position: {e}")
-            return {
-                "summary": f"Error creating summary: {str(e)}",
-                "sources": [],
-                "raw_results_count": 0
-            }
\ No newline at end of file
+    def _filter_results(self, results: List[Dict]) -> List[Dict]:
+        """Drop low-score and near-empty results, keeping all if none pass"""
+        filtered = [
+            r for r in results
+            if r.get('score', 0) > MIN_RESULT_SCORE
+            and len(r.get('content', '')) > MIN_RESULT_CONTENT_LENGTH
+        ]
+        
+        if not filtered:
+            logger.debug("All %d results below quality threshold, keeping unfiltered", len(results))
+            return results
+        
+        logger.debug("Dropped %d of %d low-quality results", len(results) - len(filtered), len(results))
+        return filtered
@@ -1,6 +1,12 @@
 # src/ui/pages/home.py
 import streamlit as st
-from src.ui.utils import init_session_state
+from src.ui.utils import init_session_state, get_orchestrator
+
+@st.cache_data(ttl=60, show_spinner=False)
+def _has_memory(filter_type: str, signature: int) -> bool:
+    """Cached status probe; signature changes whenever memory is added to"""
+    # Cached process-wide, so use the shared orchestrator rather than this session's state
+    return get_orchestrator().long_term_memory.exists(filter_type)
 
 def render_home():
     """Render the home page"""
@@ -191,17 +197,20 @@ def render_home():
     
     col1, col2, col3 = st.columns(3)
     
+    try:
+        memory_signature = st.session_state.orchestrator.long_term_memory.count()
+    except:
+        memory_signature = 0
+    
     # Check if CV uploaded
     try:
-        cv_results = st.session_state.orchestrator.long_term_memory.search("CV", k=1, filter_type="cv")
-        cv_status = "✅ CV Uploaded" if cv_results else "⚠️ No CV"
+        cv_status = "✅ CV Uploaded" if _has_memory("cv", memory_signature) else "⚠️ No CV"
     except:
         cv_status = "⚠️ No CV"
     
     # Check if experiences added
     try:
-        exp_results = st.session_state.orchestrator.long_term_memory.search("experience", k=1, filter_type="experience")
-        exp_status = "✅ Experiences Added" if exp_results else "⚠️ No Experiences"
+        exp_status = "✅ Experiences Added" if _has_memory("experience", memory_signature) else "⚠️ No Experiences"
     except:
         exp_status = "⚠️ No Experiences"
     
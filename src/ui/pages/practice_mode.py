@@ -1,12 +1,50 @@
 # src/ui/pages/practice_mode.py
 import streamlit as st
-from src.ui.utils import init_session_state, display_answer_section, display_question_analysis
-import datetime
+from src.ui.utils import init_session_state, display_answer_section, display_question_analysis, append_practice_history
+
+@st.cache_data(show_spinner=False)
+def _question_options(types: tuple, texts: tuple) -> list:
+    """Selectbox labels for the mock questions"""
+    return [f"{q_type.upper()}: {text[:80]}..." for q_type, text in zip(types, texts)]
+
+@st.fragment
+def _follow_up_panel():
+    """Follow-up practice, rerun on its own so the main answer is not re-rendered"""
+    st.header("🔄 Practice Follow-up Questions")
+    
+    follow_up_question = st.text_input(
+        "Ask a follow-up question (or use predicted ones above):",
+        placeholder="e.g., What would you do differently next time?"
+    )
+    
+    if st.button("Generate Follow-up Answer", disabled=not follow_up_question):
+        with st.spinner("Generating follow-up answer..."):
+            try:
+                follow_up_result = st.session_state.orchestrator.practice_follow_up(
+                    follow_up_question=follow_up_question
+                )
+                
+                st.success("✅ Follow-up answer generated!")
+                
+                st.markdown("### Follow-up Answer")
+                st.markdown(follow_up_result.get('answer', ''))
+                
+                # Show scores
+                if follow_up_result.get('critique_scores'):
+                    from src.ui.utils import display_score_card
+                    scores = follow_up_result['critique_scores'].get('scores', {})
+                    scores['overall'] = follow_up_result['critique_scores'].get('overall', 0)
+                    display_score_card(scores, "Follow-up Answer Quality")
+            
+            except Exception as e:
+                st.error(f"❌ Error: {e}")
 
 def render_practice_mode():
     """Render the practice mode page"""
     init_session_state()
     
+    ss = st.session_state
+    
     st.title("💪 Practice Mode")
     st.markdown("Practice answering interview questions with AI-powered feedback and iteration.")
     
@@ -28,7 +66,7 @@ def render_practice_mode():
         )
         
         if st.button("💾 Save Context"):
-            st.session_state.orchestrator.create_session(
+            ss.orchestrator.create_session(
                 job_description=context_job_desc,
                 company_name=context_company,
                 position=context_position,
@@ -55,11 +93,12 @@ def render_practice_mode():
             placeholder="e.g., Tell me about a time you faced a challenging technical problem..."
         )
     else:
-        if st.session_state.mock_questions:
-            question_options = [
-                f"{q.get('type', 'Q').upper()}: {q.get('question', '')[:80]}..."
-                for q in st.session_state.mock_questions
-            ]
+        mock_questions = ss.mock_questions
+        if mock_questions:
+            question_options = _question_options(
+                tuple(q.get('type', 'Q') for q in mock_questions),
+                tuple(q.get('question', '') for q in mock_questions)
+            )
             
             selected_idx = st.selectbox(
                 "Select a question:",
@@ -67,7 +106,7 @@ def render_practice_mode():
                 format_func=lambda i: question_options[i]
             )
             
-            question = st.session_state.mock_questions[selected_idx].get('question', '')
+            question = mock_questions[selected_idx].get('question', '')
             st.info(f"**Selected Question:** {question}")
         else:
             st.warning("No mock questions available. Go to Preparation Mode to generate questions first.")
@@ -83,28 +122,42 @@ def render_practice_mode():
     if generate_button and question:
         with st.spinner("🤔 Analyzing question and generating answer... This may take 30-60 seconds."):
             try:
-                result = st.session_state.orchestrator.practice_question(
+                answer_stream = ss.orchestrator.practice_question_stream(
                     question=question,
                     use_session_context=use_context if question_source == "Enter manually" else True
                 )
                 
+                # Preview the final answer as it is written; the full result renders below
+                preview = st.empty()
+                with preview.container():
+                    st.write_stream(answer_stream)
+                preview.empty()
+                
+                result = answer_stream.result
+                
                 # Store in session state
-                st.session_state.last_result = result
-                st.session_state.last_question = question
+                ss.last_result = result
+                ss.last_question = question
                 
                 st.success("✅ Answer generated!")
                 
             except Exception as e:
                 st.error(f"❌ Error generating answer: {e}")
-                st.session_state.last_result = None
+                ss.last_result = None
+        
+        # Saving history is best effort; a disk error must not discard the answer
+        if ss.last_result:
+            try:
+                append_practice_history(question, ss.last_result.get('answer', ''))
+            except OSError as e:
+                st.warning(f"⚠️ Could not save practice history: {e}")
     
     # Display Results
-    if hasattr(st.session_state, 'last_result') and st.session_state.last_result:
+    result = ss.get('last_result')
+    if result:
         st.markdown("---")
         st.header("📝 Your Interview Answer")
         
-        result = st.session_state.last_result
-        
         # Question Analysis
         if result.get('question_analysis'):
             display_question_analysis(result['question_analysis'])
@@ -115,34 +168,7 @@ def render_practice_mode():
         st.markdown("---")
         
         # Follow-up Section
-        st.header("🔄 Practice Follow-up Questions")
-        
-        follow_up_question = st.text_input(
-            "Ask a follow-up question (or use predicted ones above):",
-            placeholder="e.g., What would you do differently next time?"
-        )
-        
-        if st.button("Generate Follow-up Answer", disabled=not follow_up_question):
-            with st.spinner("Generating follow-up answer..."):
-                try:
-                    follow_up_result = st.session_state.orchestrator.practice_follow_up(
-                        follow_up_question=follow_up_question
-                    )
-                    
-                    st.success("✅ Follow-up answer generated!")
-                    
-                    st.markdown("### Follow-up Answer")
-                    st.markdown(follow_up_result.get('answer', ''))
-                    
-                    # Show scores
-                    if follow_up_result.get('critique_scores'):
-                        from src.ui.utils import display_score_card
-                        scores = follow_up_result['critique_scores'].get('scores', {})
-                        scores['overall'] = follow_up_result['critique_scores'].get('overall', 0)
-                        display_score_card(scores, "Follow-up Answer Quality")
-                
-                except Exception as e:
-                    st.error(f"❌ Error: {e}")
+        _follow_up_panel()
         
         st.markdown("---")
         
@@ -151,8 +177,9 @@ def render_practice_mode():
         
         if st.button("📥 Export This Q&A"):
             from src.ui.utils import export_to_json
+            from datetime import datetime
             export_data = {
-                "question": st.session_state.last_question,
+                "question": ss.last_question,
                 "answer": result.get('answer', ''),
                 "scores": result.get('critique_scores', {}),
                 "key_points": result.get('key_points', []),
@@ -162,13 +189,14 @@ def render_practice_mode():
             }
             export_to_json(export_data, f"practice_qa_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json")
     
-    # Conversation History
-    if st.session_state.conversation_history:
+    # Conversation History (append_practice_history keeps only the most recent entries)
+    conversation_history = ss.conversation_history
+    if conversation_history:
         st.markdown("---")
         st.header("📜 Practice History")
         
-        with st.expander("View All Practice Sessions"):
-            for i, conv in enumerate(st.session_state.conversation_history, 1):
+        with st.expander("View Recent Practice Sessions"):
+            for i, conv in enumerate(conversation_history, 1):
                 st.markdown(f"### Session {i}")
                 st.markdown(f"**Q:** {conv.get('question', '')}")
                 st.markdown(f"**A:** {conv.get('answer', '')[:200]}...")
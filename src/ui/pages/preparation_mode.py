@@ -1,18 +1,87 @@
 # src/ui/pages/preparation_mode.py
 import streamlit as st
+from collections import Counter
+from math import ceil
 from src.ui.utils import init_session_state, display_progress_bar
-from datetime import datetime
+
+QUESTIONS_PER_PAGE = 10
+
+# Color coding for the question list
+TYPE_COLORS = {
+    'Behavioral': '🔵',
+    'Technical': '🟢',
+    'Situational': '🟡'
+}
+
+DIFFICULTY_EMOJIS = {
+    'Easy': '⭐',
+    'Medium': '⭐⭐',
+    'Hard': '⭐⭐⭐'
+}
+
+@st.fragment
+def _question_list(questions):
+    """Filterable, paginated question list; filter and page changes rerun only this fragment"""
+    # Filter options
+    filter_type = st.selectbox(
+        "Filter by type:",
+        ["All", "Behavioral", "Technical", "Situational"]
+    )
+    
+    filter_difficulty = st.selectbox(
+        "Filter by difficulty:",
+        ["All", "Easy", "Medium", "Hard"]
+    )
+    
+    # Display questions
+    filtered_questions = [
+        q for q in questions
+        if (filter_type == "All" or q.get('type', '').lower() == filter_type.lower())
+        and (filter_difficulty == "All" or q.get('difficulty', '').lower() == filter_difficulty.lower())
+    ]
+    
+    st.info(f"Showing {len(filtered_questions)} questions")
+    
+    # Only materialize one page of expanders at a time
+    page_count = max(1, ceil(len(filtered_questions) / QUESTIONS_PER_PAGE))
+    page = 1
+    if page_count > 1:
+        page = st.number_input("Page", min_value=1, max_value=page_count, value=1, step=1)
+    
+    start = (page - 1) * QUESTIONS_PER_PAGE
+    page_questions = filtered_questions[start:start + QUESTIONS_PER_PAGE]
+    
+    for i, q in enumerate(page_questions, start + 1):
+        q_type = q.get('type', 'Unknown').title()
+        q_difficulty = q.get('difficulty', 'Medium').title()
+        q_text = q.get('question', '')
+        themes = q.get('themes', [])
+        
+        # Color coding
+        type_color = TYPE_COLORS.get(q_type, '⚪')
+        difficulty_emoji = DIFFICULTY_EMOJIS.get(q_difficulty, '⭐⭐')
+        
+        with st.expander(f"{type_color} Q{i}: {q_text[:80]}... {difficulty_emoji}"):
+            st.markdown(f"**Question:** {q_text}")
+            st.markdown(f"**Type:** {q_type}")
+            st.markdown(f"**Difficulty:** {q_difficulty}")
+            if themes:
+                st.markdown(f"**Themes:** {', '.join(themes)}")
+            st.markdown(f"**Framework:** {q.get('expected_framework', 'STAR')}")
 
 def render_preparation_mode():
     """Render the preparation mode page"""
     init_session_state()
     
+    ss = st.session_state
+    
     st.title("🔍 Preparation Mode")
     st.markdown("Research the company and generate mock interview questions tailored to the role.")
     
-    # Job Details Input
-    with st.container():
-        st.header("Job Details")
+    # Job Details Input (a form, so editing fields doesn't rerun the page)
+    st.header("Job Details")
+    
+    with st.form("job_details"):
         
         col1, col2 = st.columns(2)
         
@@ -39,36 +108,39 @@ def render_preparation_mode():
             placeholder="Paste the full job description here..."
         )
         
-        start_research = st.button(
+        start_research = st.form_submit_button(
             "🚀 Start Research & Generate Questions",
-            type="primary",
-            disabled=not all([company_name, position, job_description])
+            type="primary"
         )
     
+    if start_research and not all([company_name, position, job_description]):
+        st.error("❌ Please fill in all required fields (*)")
+        start_research = False
+    
     # Research Results
     if start_research:
         with st.spinner("🔍 Researching company and generating questions... This may take 1-2 minutes."):
             try:
-                result = st.session_state.orchestrator.prepare_for_interview(
+                result = ss.orchestrator.prepare_for_interview(
                     company_name=company_name,
                     position=position,
                     job_description=job_description,
                     force_refresh=force_refresh
                 )
                 
-                st.session_state.preparation_complete = True
-                st.session_state.mock_questions = result["questions"]
-                st.session_state.research_data = result["research_data"]
+                ss.preparation_complete = True
+                ss.mock_questions = result["questions"]
+                ss.research_data = result["research_data"]
                 
                 st.success("✅ Research complete! Mock interview ready.")
                 st.balloons()
                 
             except Exception as e:
                 st.error(f"❌ Error during preparation: {e}")
-                st.session_state.preparation_complete = False
+                ss.preparation_complete = False
     
     # Display Results
-    if st.session_state.preparation_complete:
+    if ss.preparation_complete:
         st.markdown("---")
         
         # Research Summary
@@ -81,7 +153,7 @@ def render_preparation_mode():
             "💼 Position Analysis"
         ])
         
-        research_data = st.session_state.get('research_data', {})
+        research_data = ss.get('research_data', {})
         
         with research_tabs[0]:
             st.markdown("### Company Overview")
@@ -108,79 +180,30 @@ def render_preparation_mode():
         # Mock Questions
         st.header("💭 Generated Mock Interview Questions")
         
-        questions = st.session_state.mock_questions
+        questions = ss.mock_questions
         
         if questions:
             # Statistics
             col1, col2, col3, col4 = st.columns(4)
             
-            behavioral = sum(1 for q in questions if q.get('type') == 'behavioral')
-            technical = sum(1 for q in questions if q.get('type') == 'technical')
-            situational = sum(1 for q in questions if q.get('type') == 'situational')
+            type_counts = Counter(q.get('type') for q in questions)
             
             col1.metric("Total Questions", len(questions))
-            col2.metric("Behavioral", behavioral)
-            col3.metric("Technical", technical)
-            col4.metric("Situational", situational)
+            col2.metric("Behavioral", type_counts['behavioral'])
+            col3.metric("Technical", type_counts['technical'])
+            col4.metric("Situational", type_counts['situational'])
             
             st.markdown("---")
             
-            # Filter options
-            filter_type = st.selectbox(
-                "Filter by type:",
-                ["All", "Behavioral", "Technical", "Situational"]
-            )
-            
-            filter_difficulty = st.selectbox(
-                "Filter by difficulty:",
-                ["All", "Easy", "Medium", "Hard"]
-            )
-            
-            # Display questions
-            filtered_questions = questions
-            
-            if filter_type != "All":
-                filtered_questions = [q for q in filtered_questions if q.get('type', '').lower() == filter_type.lower()]
-            
-            if filter_difficulty != "All":
-                filtered_questions = [q for q in filtered_questions if q.get('difficulty', '').lower() == filter_difficulty.lower()]
-            
-            st.info(f"Showing {len(filtered_questions)} questions")
-            
-            for i, q in enumerate(filtered_questions, 1):
-                q_type = q.get('type', 'Unknown').title()
-                q_difficulty = q.get('difficulty', 'Medium').title()
-                q_text = q.get('question', '')
-                themes = q.get('themes', [])
-                
-                # Color coding
-                type_color = {
-                    'Behavioral': '🔵',
-                    'Technical': '🟢',
-                    'Situational': '🟡'
-                }.get(q_type, '⚪')
-                
-                difficulty_emoji = {
-                    'Easy': '⭐',
-                    'Medium': '⭐⭐',
-                    'Hard': '⭐⭐⭐'
-                }.get(q_difficulty, '⭐⭐')
-                
-                with st.expander(f"{type_color} Q{i}: {q_text[:80]}... {difficulty_emoji}"):
-                    st.markdown(f"**Question:** {q_text}")
-                    st.markdown(f"**Type:** {q_type}")
-                    st.markdown(f"**Difficulty:** {q_difficulty}")
-                    if themes:
-                        st.markdown(f"**Themes:** {', '.join(themes)}")
-                    st.markdown(f"**Framework:** {q.get('expected_framework', 'STAR')}")
+            _question_list(questions)
             
             st.markdown("---")
             
             # Start Mock Interview
             if st.button("🎭 Start Mock Interview", type="primary"):
-                st.session_state.current_mode = "mock_interview"
-                st.session_state.mock_interview_active = True
-                st.session_state.current_question_index = 0
+                ss.current_mode = "mock_interview"
+                ss.mock_interview_active = True
+                ss.current_question_index = 0
                 st.rerun()
         
         else:
@@ -1,11 +1,70 @@
 # src/ui/pages/profile_setup.py
 import streamlit as st
-from src.utils.document_parser import DocumentParser
-from src.ui.utils import init_session_state
+from src.ui.utils import init_session_state, clear_practice_history
 from typing import Optional
-import tempfile
+import hashlib
+import io
 import os
-import datetime
+
+COMM_STYLES = (
+    "Direct and concise",
+    "Detailed and thorough",
+    "Collaborative and inclusive",
+    "Analytical and data-driven",
+    "Creative and innovative"
+)
+
+WORK_VALUES = (
+    "Innovation",
+    "Collaboration",
+    "Independence",
+    "Growth",
+    "Impact",
+    "Work-life balance",
+    "Leadership",
+    "Technical excellence",
+    "Mentorship",
+    "Diversity"
+)
+
+STRENGTHS = (
+    "Problem-solving",
+    "Leadership",
+    "Technical skills",
+    "Communication",
+    "Creativity",
+    "Analytical thinking",
+    "Adaptability",
+    "Team collaboration",
+    "Project management",
+    "Strategic thinking"
+)
+
+WEAKNESSES = (
+    "Public speaking",
+    "Delegation",
+    "Time management",
+    "Saying no",
+    "Technical depth in specific areas",
+    "Patience",
+    "Detail orientation",
+    "Big picture thinking",
+    "Networking"
+)
+
+@st.cache_data(show_spinner=False, max_entries=32)
+def _parse_upload(digest: str, suffix: str, _data: bytes) -> tuple:
+    """Parse uploaded CV bytes once per unique file (keyed on digest, _data is not hashed)
+    
+    Returns:
+        (cv_text, blocks); blocks are the PDF layout blocks, or None for other formats
+    """
+    from src.utils.document_parser import DocumentParser
+    if suffix == '.pdf':
+        # One pass over the PDF: the blocks double as the preview text
+        blocks = DocumentParser.parse_pdf_blocks(_data)
+        return "\n\n".join(blocks), blocks
+    return DocumentParser.parse_document_stream(io.BytesIO(_data), suffix), None
 
 def render_profile_setup():
     """Render the profile setup page"""
@@ -44,6 +103,7 @@ def render_cv_upload():
     )
     
     cv_text = None
+    cv_blocks = None
     
     if upload_method == "Upload File (PDF/DOCX/TXT)":
         uploaded_file = st.file_uploader(
@@ -53,21 +113,17 @@ def render_cv_upload():
         )
         
         if uploaded_file is not None:
-            # Save to temp file
-            with tempfile.NamedTemporaryFile(delete=False, suffix=os.path.splitext(uploaded_file.name)[1]) as tmp_file:
-                tmp_file.write(uploaded_file.getvalue())
-                tmp_path = tmp_file.name
-            
             try:
-                cv_text = DocumentParser.parse_document(tmp_path)
+                data = uploaded_file.getvalue()
+                digest = hashlib.blake2b(data, digest_size=16).hexdigest()
+                suffix = os.path.splitext(uploaded_file.name)[1].lower()
+                cv_text, cv_blocks = _parse_upload(digest, suffix, data)
                 st.success(f"✅ File uploaded: {uploaded_file.name}")
                 
                 with st.expander("Preview extracted text"):
                     st.text_area("CV Content", cv_text, height=300, disabled=True)
             except Exception as e:
                 st.error(f"❌ Error parsing file: {e}")
-            finally:
-                os.unlink(tmp_path)
     
     else:
         cv_text = st.text_area(
@@ -98,7 +154,7 @@ def render_cv_upload():
         }
         
         with st.spinner("Saving CV to long-term memory..."):
-            st.session_state.orchestrator.add_cv(cv_text, metadata)
+            st.session_state.orchestrator.add_cv(cv_text, metadata, cv_blocks)
         
         st.success("✅ CV saved successfully!")
         st.balloons()
@@ -140,7 +196,7 @@ def render_experience_library():
         tags = [tag.strip() for tag in tags_input.split(",") if tag.strip()]
         
         if st.button("💾 Save Experience", type="primary"):
-            if all([situation, task, action, result]):
+            if situation and task and action and result:
                 # Format as STAR
                 experience_text = f"""
 **{experience_title}**
@@ -198,31 +254,14 @@ def render_personality_profile():
     st.subheader("Communication Style")
     comm_style = st.selectbox(
         "How would you describe your communication style?",
-        [
-            "Direct and concise",
-            "Detailed and thorough",
-            "Collaborative and inclusive",
-            "Analytical and data-driven",
-            "Creative and innovative"
-        ]
+        COMM_STYLES
     )
     
     # Work Values
     st.subheader("Work Values")
     work_values = st.multiselect(
         "What do you value most in your work? (Select up to 5)",
-        [
-            "Innovation",
-            "Collaboration",
-            "Independence",
-            "Growth",
-            "Impact",
-            "Work-life balance",
-            "Leadership",
-            "Technical excellence",
-            "Mentorship",
-            "Diversity"
-        ],
+        WORK_VALUES,
         max_selections=5
     )
     
@@ -230,18 +269,7 @@ def render_personality_profile():
     st.subheader("Strengths")
     strengths = st.multiselect(
         "What are your key strengths? (Select up to 5)",
-        [
-            "Problem-solving",
-            "Leadership",
-            "Technical skills",
-            "Communication",
-            "Creativity",
-            "Analytical thinking",
-            "Adaptability",
-            "Team collaboration",
-            "Project management",
-            "Strategic thinking"
-        ],
+        STRENGTHS,
         max_selections=5
     )
     
@@ -249,17 +277,7 @@ def render_personality_profile():
     st.subheader("Areas for Improvement")
     weaknesses = st.multiselect(
         "What areas are you working to improve? (Select up to 3)",
-        [
-            "Public speaking",
-            "Delegation",
-            "Time management",
-            "Saying no",
-            "Technical depth in specific areas",
-            "Patience",
-            "Detail orientation",
-            "Big picture thinking",
-            "Networking"
-        ],
+        WEAKNESSES,
         max_selections=3
     )
     
@@ -312,6 +330,7 @@ def render_data_management():
     if st.button("🗑️ Clear ALL Profile Data", type="secondary"):
         if st.checkbox("I confirm I want to delete EVERYTHING"):
             st.session_state.orchestrator.long_term_memory.clear_all()
+            clear_practice_history()
             st.success("All profile data cleared")
             st.balloons()
     
@@ -323,6 +342,7 @@ def render_data_management():
         session_data = st.session_state.orchestrator.export_session()
         if session_data:
             from src.ui.utils import export_to_json
+            from datetime import datetime
             export_to_json(session_data, f"interview_session_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json")
         else:
             st.info("No active session to export")
\ No newline at end of file
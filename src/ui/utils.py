@@ -1,32 +1,97 @@
 # src/ui/utils.py
 import streamlit as st
 from typing import Dict, Any, List
-import json
+import orjson
+import os
+import tempfile
+import threading
 from datetime import datetime
+from copy import copy
+
+_DEFAULTS = {
+    'current_mode': "practice",
+    'mock_interview_active': False,
+    'preparation_complete': False,
+    'mock_questions': [],
+    'current_question_index': 0
+}
+
+_HISTORY_LOCK = threading.Lock()
+
+@st.cache_resource(show_spinner=False)
+def get_orchestrator():
+    """Build the orchestrator (Chroma clients, LLMs, compiled graph) once per process"""
+    from src.agents.orchestrator import InterviewPrepOrchestrator
+    return InterviewPrepOrchestrator()
 
 def init_session_state():
-    """Initialize Streamlit session state"""
-    if 'orchestrator' not in st.session_state:
-        from src.agents.orchestrator import InterviewPrepOrchestrator
-        st.session_state.orchestrator = InterviewPrepOrchestrator()
-    
-    if 'current_mode' not in st.session_state:
-        st.session_state.current_mode = "practice"
+    """Initialize Streamlit session state (once per session; later calls are no-ops)"""
+    if st.session_state.get('_initialized'):
+        return
     
-    if 'mock_interview_active' not in st.session_state:
-        st.session_state.mock_interview_active = False
+    if 'orchestrator' not in st.session_state:
+        st.session_state.orchestrator = get_orchestrator().fork()
     
     if 'conversation_history' not in st.session_state:
-        st.session_state.conversation_history = []
-    
-    if 'preparation_complete' not in st.session_state:
-        st.session_state.preparation_complete = False
+        st.session_state.conversation_history = load_practice_history()
     
-    if 'mock_questions' not in st.session_state:
-        st.session_state.mock_questions = []
+    # Copy so sessions never share the mutable defaults
+    for key, value in _DEFAULTS.items():
+        st.session_state.setdefault(key, copy(value))
     
-    if 'current_question_index' not in st.session_state:
-        st.session_state.current_question_index = 0
+    st.session_state._initialized = True
+
+def load_practice_history() -> List[Dict[str, Any]]:
+    """Load the most recent practice history saved by any session"""
+    from src.config.settings import settings
+    try:
+        history = orjson.loads(settings.practice_history_file.read_bytes())
+    except (FileNotFoundError, orjson.JSONDecodeError):
+        return []
+    return history[-settings.practice_history_max_entries:]
+
+def _write_practice_history(history: List[Dict[str, Any]]):
+    """Atomically replace the practice history file"""
+    from src.config.settings import settings
+    
+    # Write beside the target and swap it in, so readers never see a half-written file
+    path = settings.practice_history_file
+    tmp = tempfile.NamedTemporaryFile(dir=path.parent, prefix=path.name, suffix=".tmp", delete=False)
+    try:
+        with tmp:
+            tmp.write(orjson.dumps(history, option=orjson.OPT_INDENT_2))
+        os.replace(tmp.name, path)
+    except BaseException:
+        # Don't leave a stray .tmp file in data/ on a failed save
+        os.unlink(tmp.name)
+        raise
+
+def append_practice_history(question: str, answer: str):
+    """Add a practiced Q&A to the session history and save it to disk"""
+    from src.config.settings import settings
+    max_entries = settings.practice_history_max_entries
+    entry = {
+        "question": question,
+        "answer": answer,
+        "timestamp": datetime.now().isoformat()
+    }
+    history = st.session_state.conversation_history
+    history.append(entry)
+    del history[:-max_entries]
+    
+    # Sessions are threads of one server process: re-read under the lock and append,
+    # so concurrent tabs add to the file instead of overwriting each other
+    with _HISTORY_LOCK:
+        saved = load_practice_history()
+        saved.append(entry)
+        _write_practice_history(saved[-max_entries:])
+
+def clear_practice_history():
+    """Delete the saved practice history and this session's copy"""
+    from src.config.settings import settings
+    with _HISTORY_LOCK:
+        settings.practice_history_file.unlink(missing_ok=True)
+    st.session_state.conversation_history = []
 
 def display_score_card(scores: Dict[str, float], title: str = "Answer Quality Scores"):
     """Display score card with visual indicators"""
@@ -152,10 +217,11 @@ def format_conversation_message(role: str, content: str, timestamp: str = None):
 
 def export_to_json(data: Dict[str, Any], filename: str):
     """Export data to JSON file"""
-    json_str = json.dumps(data, indent=2)
+    # orjson serializes straight to bytes (and handles datetimes in session exports)
+    json_bytes = orjson.dumps(data, option=orjson.OPT_INDENT_2)
     st.download_button(
         label="📥 Download as JSON",
-        data=json_str,
+        data=json_bytes,
         file_name=filename,
         mime="application/json"
     )
@@ -1,43 +1,96 @@
 # src/utils/document_parser.py
-from typing import Optional
-import PyPDF2
+from typing import Optional, BinaryIO, Union, List
+import codecs
+import io
+import fitz
 import docx
 from pathlib import Path
 
+def _open_pdf(source: Union[str, bytes]) -> "fitz.Document":
+    """Open a PDF from a path or raw bytes"""
+    if isinstance(source, bytes):
+        return fitz.open(stream=source, filetype="pdf")
+    return fitz.open(source)
+
+def _extract_pdf_text(source: Union[str, bytes]) -> str:
+    """Extract PDF text page by page"""
+    with _open_pdf(source) as doc:
+        return "\n".join(page.get_text("text") for page in doc)
+
+def _extract_pdf_blocks(source: Union[str, bytes]) -> List[str]:
+    """Extract non-empty text blocks (roughly paragraphs) in reading order"""
+    with _open_pdf(source) as doc:
+        return [
+            block[4].strip()
+            for page in doc
+            for block in page.get_text("blocks")
+            if block[6] == 0 and block[4].strip()  # block_type 0 is text, 1 is image
+        ]
+
+# Checked in order: the UTF-32 LE BOM starts with the UTF-16 LE one
+_BOMS = (
+    (codecs.BOM_UTF32_LE, 'utf-32'),
+    (codecs.BOM_UTF32_BE, 'utf-32'),
+    (codecs.BOM_UTF8, 'utf-8-sig'),
+    (codecs.BOM_UTF16_LE, 'utf-16'),
+    (codecs.BOM_UTF16_BE, 'utf-16'),
+)
+
+def _decode_text(data: bytes) -> str:
+    """Decode plain-text bytes, honouring a BOM and falling back to Windows-1252"""
+    for bom, encoding in _BOMS:
+        if data.startswith(bom):
+            return data.decode(encoding, errors='replace')
+    try:
+        return data.decode('utf-8')
+    except UnicodeDecodeError:
+        return data.decode('cp1252', errors='replace')
+
 class DocumentParser:
     """Parse various document formats"""
     
     @staticmethod
     def parse_pdf(file_path: str) -> str:
         """Extract text from PDF"""
-        text = ""
         try:
-            with open(file_path, 'rb') as file:
-                pdf_reader = PyPDF2.PdfReader(file)
-                for page in pdf_reader.pages:
-                    text += page.extract_text()
+            return _extract_pdf_text(file_path)
         except Exception as e:
             print(f"Error parsing PDF: {e}")
-        return text
+            return ""
+    
+    @staticmethod
+    def parse_pdf_blocks(source: Union[str, bytes]) -> List[str]:
+        """Extract PDF text as layout blocks, ready to embed without re-chunking
+        
+        Args:
+            source: Path to the PDF or its raw bytes
+            
+        Returns:
+            Text of each non-empty block, in page order
+        """
+        try:
+            return _extract_pdf_blocks(source)
+        except Exception as e:
+            print(f"Error parsing PDF blocks: {e}")
+            return []
     
     @staticmethod
     def parse_docx(file_path: str) -> str:
         """Extract text from DOCX"""
-        text = ""
+        parts = []
         try:
             doc = docx.Document(file_path)
             for paragraph in doc.paragraphs:
-                text += paragraph.text + "\n"
+                parts.append(paragraph.text)
         except Exception as e:
             print(f"Error parsing DOCX: {e}")
-        return text
+        return "\n".join(parts)
     
     @staticmethod
     def parse_txt(file_path: str) -> str:
         """Extract text from TXT"""
         try:
-            with open(file_path, 'r', encoding='utf-8') as file:
-                return file.read()
+            return _decode_text(Path(file_path).read_bytes())
         except Exception as e:
             print(f"Error parsing TXT: {e}")
             return ""
@@ -55,4 +108,36 @@ class DocumentParser:
         elif extension == '.txt':
             return DocumentParser.parse_txt(file_path)
         else:
-            raise ValueError(f"Unsupported file format: {extension}")
\ No newline at end of file
+            raise ValueError(f"Unsupported file format: {extension}")
+    
+    @staticmethod
+    def parse_document_stream(buffer: BinaryIO, suffix: str) -> str:
+        """Parse an in-memory document (e.g. a Streamlit upload) without touching disk
+        
+        Args:
+            buffer: File-like object holding the document bytes
+            suffix: File extension used to pick the parser, e.g. '.pdf'
+            
+        Returns:
+            Extracted text
+        """
+        extension = suffix.lower()
+        
+        if extension not in ['.pdf', '.docx', '.doc', '.txt']:
+            raise ValueError(f"Unsupported file format: {extension}")
+        
+        # Uploads can be re-read across reruns, so always start from the top
+        if buffer.seekable():
+            buffer.seek(0)
+        data = buffer.read()
+        try:
+            if extension == '.pdf':
+                return _extract_pdf_text(data)
+            elif extension in ['.docx', '.doc']:
+                doc = docx.Document(io.BytesIO(data))
+                return "\n".join(paragraph.text for paragraph in doc.paragraphs)
+            else:
+                return _decode_text(data)
+        except Exception as e:
+            print(f"Error parsing {extension} stream: {e}")
+            return ""
\ No newline at end of file
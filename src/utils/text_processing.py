@@ -1,6 +1,10 @@
 # src/utils/text_processing.py
-from typing import List, Dict
+from typing import List, Dict, Iterator
 import re
+from bisect import bisect_left
+
+_WS_RE = re.compile(r'\s+')
+_PUNCT_RE = re.compile(r'[^\w\s.,!?;:()\-]')
 
 class TextProcessor:
     """Text processing utilities"""
@@ -8,27 +12,48 @@ class TextProcessor:
     @staticmethod
     def clean_text(text: str) -> str:
         """Clean and normalize text"""
-        # Remove extra whitespace
-        text = re.sub(r'\s+', ' ', text)
-        # Remove special characters but keep basic punctuation
-        text = re.sub(r'[^\w\s.,!?;:()\-]', '', text)
-        return text.strip()
+        if not text:
+            return ""
+        
+        # Collapse whitespace, then drop special characters but keep basic punctuation
+        return _PUNCT_RE.sub('', _WS_RE.sub(' ', text)).strip()
     
     @staticmethod
     def extract_sections(text: str, sections: List[str]) -> Dict[str, str]:
         """Extract sections from CV text"""
-        result = {}
         text_lower = text.lower()
+        names = {section.lower() for section in sections if section}
+        positions = {name: [] for name in names}
+        
+        # One scan records every occurrence of every heading. The lookahead tries each start
+        # position, and names that prefix a longer match ("skills" in "skills summary") share it
+        if names:
+            ordered = sorted(names, key=len, reverse=True)
+            prefixes = {name: [other for other in ordered if other != name and name.startswith(other)] for name in ordered}
+            pattern = re.compile("(?=(" + "|".join(re.escape(name) for name in ordered) + "))")
+            for match in pattern.finditer(text_lower):
+                key = match.group(1)
+                positions[key].append(match.start())
+                for name in prefixes[key]:
+                    positions[name].append(match.start())
+        
+        def find(name: str, pos: int) -> int:
+            """str.find over the recorded occurrences"""
+            if not name:
+                return pos if pos <= len(text_lower) else -1
+            hits = positions[name]
+            i = bisect_left(hits, pos)
+            return hits[i] if i < len(hits) else -1
         
+        result = {}
         for i, section in enumerate(sections):
-            section_lower = section.lower()
-            start_idx = text_lower.find(section_lower)
+            start_idx = find(section.lower(), 0)
             
             if start_idx != -1:
                 # Find the end (next section or end of text)
                 end_idx = len(text)
                 for next_section in sections[i+1:]:
-                    next_idx = text_lower.find(next_section.lower(), start_idx + 1)
+                    next_idx = find(next_section.lower(), start_idx + 1)
                     if next_idx != -1:
                         end_idx = next_idx
                         break
@@ -38,16 +63,19 @@ class TextProcessor:
         return result
     
     @staticmethod
-    def chunk_text(text: str, chunk_size: int = 1000, overlap: int = 200) -> List[str]:
-        """Split text into overlapping chunks"""
-        chunks = []
+    def chunk_text(text: str, chunk_size: int = 1000, overlap: int = 200) -> Iterator[str]:
+        """Lazily yield overlapping chunks of text"""
+        if not text:
+            return
+        
+        # Most STAR entries and short fields fit in a single chunk
+        if len(text) <= chunk_size:
+            yield text
+            return
+        
         start = 0
         text_length = len(text)
         
         while start < text_length:
-            end = start + chunk_size
-            chunk = text[start:end]
-            chunks.append(chunk)
+            yield text[start:start + chunk_size]
             start += chunk_size - overlap
-        
-        return chunks
\ No newline at end of file
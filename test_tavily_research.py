@@ -2,7 +2,8 @@
 from dotenv import load_dotenv
 import os
 from tavily import TavilyClient
-import json
+from concurrent.futures import ThreadPoolExecutor
+import orjson
 
 load_dotenv()
 
@@ -18,16 +19,37 @@ def test_tavily_search():
     print(f"Testing Tavily Search for: {company}")
     print("=" * 80)
     
+    overview_query = f"{company} company overview mission values products services"
+    culture_query = f"{company} company culture work environment employee reviews benefits"
+    news_query = f"{company} latest news announcements 2024 2025"
+    
+    # The three searches are independent, so run them concurrently
+    with ThreadPoolExecutor(max_workers=3) as executor:
+        overview_future = executor.submit(
+            client.search,
+            query=overview_query,
+            search_depth="advanced",
+            max_results=5
+        )
+        culture_future = executor.submit(
+            client.search,
+            query=culture_query,
+            search_depth="advanced",
+            max_results=5
+        )
+        news_future = executor.submit(
+            client.search,
+            query=news_query,
+            search_depth="advanced",
+            max_results=5,
+            days=90  # Last 90 days
+        )
+    
     # Test 1: Company Overview
     print("\n1️⃣ COMPANY OVERVIEW SEARCH")
     print("-" * 80)
     
-    overview_query = f"{company} company overview mission values products services"
-    overview_results = client.search(
-        query=overview_query,
-        search_depth="advanced",
-        max_results=5
-    )
+    overview_results = overview_future.result()
     
     print(f"Query: {overview_query}")
     print(f"\nResults found: {len(overview_results.get('results', []))}")
@@ -43,12 +65,7 @@ def test_tavily_search():
     print("\n\n2️⃣ COMPANY CULTURE SEARCH")
     print("-" * 80)
     
-    culture_query = f"{company} company culture work environment employee reviews benefits"
-    culture_results = client.search(
-        query=culture_query,
-        search_depth="advanced",
-        max_results=5
-    )
+    culture_results = culture_future.result()
     
     print(f"Query: {culture_query}")
     print(f"\nResults found: {len(culture_results.get('results', []))}")
@@ -62,13 +79,7 @@ def test_tavily_search():
     print("\n\n3️⃣ RECENT NEWS SEARCH")
     print("-" * 80)
     
-    news_query = f"{company} latest news announcements 2024 2025"
-    news_results = client.search(
-        query=news_query,
-        search_depth="advanced",
-        max_results=5,
-        days=90  # Last 90 days
-    )
+    news_results = news_future.result()
     
     print(f"Query: {news_query}")
     print(f"\nResults found: {len(news_results.get('results', []))}")
@@ -84,12 +95,12 @@ def test_tavily_search():
     print("Saving full results to tavily_test_results.json")
     print("=" * 80)
     
-    with open("tavily_test_results.json", "w") as f:
-        json.dump({
+    with open("tavily_test_results.json", "wb") as f:
+        f.write(orjson.dumps({
             "overview": overview_results,
             "culture": culture_results,
             "news": news_results
-        }, f, indent=2)
+        }, option=orjson.OPT_INDENT_2))
     
     print("✅ Results saved! Check tavily_test_results.json for full details")
 
@@ -0,0 +1,31 @@
+# test_text_processing.py
+from src.utils.text_processing import TextProcessor
+
+def test_heading_word_in_prose_does_not_leak_sections():
+    """A heading word used in prose earlier must not stretch later sections"""
+    text = (
+        "Summary\nEngineer with strong leadership skills.\n"
+        "Experience\nAcme, 2020-2024\n"
+        "Education\nBSc CS\n"
+        "Skills\nPython, Go"
+    )
+
+    sections = TextProcessor.extract_sections(text, ["experience", "education", "skills"])
+
+    assert sections["experience"] == "Experience\nAcme, 2020-2024"
+    assert sections["education"] == "Education\nBSc CS"
+
+def test_nested_headings_are_both_found():
+    """'experience' is still found when it only appears inside 'work experience'"""
+    text = "Work Experience\nAcme\nEducation\nBSc"
+
+    sections = TextProcessor.extract_sections(text, ["experience", "work experience", "education"])
+
+    assert sections["experience"] == "Experience\nAcme"
+    assert sections["work experience"] == "Work Experience\nAcme"
+    assert sections["education"] == "Education\nBSc"
+
+if __name__ == "__main__":
+    test_heading_word_in_prose_does_not_leak_sections()
+    test_nested_headings_are_both_found()
+    print("✅ extract_sections regression checks passed")
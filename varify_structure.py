@@ -1,75 +1,163 @@
 # Create a script to verify structure
 # verify_structure.py
 
+import argparse
+import json
 import os
-from pathlib import Path
+import posixpath
+import sys
+from concurrent.futures import ThreadPoolExecutor
+from itertools import groupby
+from operator import itemgetter
 
-def verify_structure():
-    """Verify all files are in place"""
+REQUIRED_FILES = (
+    "app.py",
+    ".env",
+    ".gitignore",
+    "pyproject.toml",
+    ".streamlit/config.toml",
     
-    required_files = [
-        "app.py",
-        ".env",
-        ".gitignore",
-        "pyproject.toml",
-        ".streamlit/config.toml",
-        
-        # Config
-        "src/config/__init__.py",
-        "src/config/settings.py",
-        
-        # Utils
-        "src/utils/__init__.py",
-        "src/utils/document_parser.py",
-        "src/utils/text_processing.py",
-        
-        # Memory
-        "src/memory/__init__.py",
-        "src/memory/long_term_memory.py",
-        "src/memory/short_term_memory.py",
-        "src/memory/company_research_cache.py",
-        
-        # Tools
-        "src/tools/__init__.py",
-        "src/tools/web_search.py",
-        "src/tools/retrieval_tools.py",
-        "src/tools/analysis_tools.py",
-        "src/tools/generation_tools.py",
-        
-        # Agents
-        "src/agents/__init__.py",
-        "src/agents/state.py",
-        "src/agents/nodes.py",
-        "src/agents/graph.py",
-        "src/agents/mock_interview.py",
-        "src/agents/orchestrator.py",
+    # Config
+    "src/config/__init__.py",
+    "src/config/settings.py",
+    
+    # Utils
+    "src/utils/__init__.py",
+    "src/utils/document_parser.py",
+    "src/utils/text_processing.py",
+    
+    # Memory
+    "src/memory/__init__.py",
+    "src/memory/long_term_memory.py",
+    "src/memory/short_term_memory.py",
+    "src/memory/company_research_cache.py",
+    
+    # Tools
+    "src/tools/__init__.py",
+    "src/tools/web_search.py",
+    "src/tools/retrieval_tools.py",
+    "src/tools/analysis_tools.py",
+    "src/tools/generation_tools.py",
+    
+    # Agents
+    "src/agents/__init__.py",
+    "src/agents/state.py",
+    "src/agents/nodes.py",
+    "src/agents/graph.py",
+    "src/agents/mock_interview.py",
+    "src/agents/orchestrator.py",
+    
+    # UI
+    "src/ui/__init__.py",
+    "src/ui/sidebar.py",
+    "src/ui/utils.py",
+    "src/ui/pages/home.py",
+    "src/ui/pages/profile_setup.py",
+    "src/ui/pages/preparation_mode.py",
+    "src/ui/pages/practice_mode.py",
+    "src/ui/pages/mock_interview.py",
+    "src/ui/pages/analytics.py",
+)
+
+CACHE_FILE = ".verify_structure.cache"
+
+# Required names grouped by parent directory, computed once at import
+_REQUIRED_BY_DIR = {
+    directory: frozenset(name for _, name in group)
+    for directory, group in groupby(
+        sorted(os.path.split(file_path) for file_path in REQUIRED_FILES),
+        key=itemgetter(0)
+    )
+}
+
+def _list_directory(directory):
+    """Names in a directory, or an empty set if it doesn't exist"""
+    try:
+        return set(os.listdir(directory or "."))
+    except (FileNotFoundError, NotADirectoryError):
+        return set()
+
+def _directory_mtimes():
+    """mtime_ns of every required directory (None if missing); any add/remove/rename bumps it"""
+    mtimes = {}
+    for directory in _REQUIRED_BY_DIR:
+        try:
+            mtimes[directory] = os.stat(directory or ".").st_mtime_ns
+        except OSError:
+            mtimes[directory] = None
+    return mtimes
+
+def _load_cache():
+    """Previous verification result, or None if there isn't a readable one"""
+    try:
+        with open(CACHE_FILE, encoding="utf-8") as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return None
+
+def _save_cache(dir_mtimes, ok):
+    """Remember the result alongside the directory mtimes it was computed from"""
+    try:
+        with open(CACHE_FILE, "w", encoding="utf-8") as f:
+            json.dump({"required": list(REQUIRED_FILES), "dir_mtimes": dir_mtimes, "ok": ok}, f)
+    except OSError:
+        pass
+
+def verify_structure(fail_fast=False):
+    """Verify all files are in place
+    
+    Args:
+        fail_fast: Stop at the first directory with a missing file instead of listing them all
         
-        # UI
-        "src/ui/__init__.py",
-        "src/ui/sidebar.py",
-        "src/ui/utils.py",
-        "src/ui/pages/home.py",
-        "src/ui/pages/profile_setup.py",
-        "src/ui/pages/preparation_mode.py",
-        "src/ui/pages/practice_mode.py",
-        "src/ui/pages/mock_interview.py",
-        "src/ui/pages/analytics.py",
-    ]
+    Returns:
+        True if every required file exists
+    """
     
-    missing_files = []
+    # Same file list, and nothing added or removed in any required directory since the last clean run
+    dir_mtimes = _directory_mtimes()
+    cache = _load_cache()
+    if (
+        cache
+        and cache.get("ok")
+        and cache.get("required") == list(REQUIRED_FILES)
+        and cache.get("dir_mtimes") == dir_mtimes
+    ):
+        print("✅ All files in place!")
+        return True
+    
+    # List each directory once (in parallel; listdir releases the GIL) and check names against it
+    missing = set()
+    executor = ThreadPoolExecutor(max_workers=min(8, len(_REQUIRED_BY_DIR)))
+    try:
+        listings = executor.map(_list_directory, _REQUIRED_BY_DIR)
+        for (directory, names), entries in zip(_REQUIRED_BY_DIR.items(), listings):
+            missing.update(posixpath.join(directory, name) for name in names - entries)
+            if fail_fast and missing:
+                break
+    finally:
+        executor.shutdown(cancel_futures=True)
     
-    for file_path in required_files:
-        if not Path(file_path).exists():
-            missing_files.append(file_path)
+    # Report in the order the files are declared
+    missing_files = [file_path for file_path in REQUIRED_FILES if file_path in missing]
+    
+    _save_cache(dir_mtimes, not missing_files)
     
     if missing_files:
-        print("❌ Missing files:")
-        for f in missing_files:
-            print(f"   - {f}")
+        # One write for the whole report rather than a print per file
+        sys.stdout.write("❌ Missing files:\n" + "".join(f"   - {f}\n" for f in missing_files))
+        sys.stdout.flush()
         return False
     else:
         print("✅ All files in place!")
         return True
 
 if __name__ == "__main__":
-    verify_structure()
\ No newline at end of file
+    parser = argparse.ArgumentParser(description="Verify the project file structure")
+    parser.add_argument(
+        "--fail-fast",
+        action="store_true",
+        help="stop at the first directory with a missing file"
+    )
+    args = parser.parse_args()
+    
+    raise SystemExit(0 if verify_structure(fail_fast=args.fail_fast) else 1)